@@ -1,5 +1,7 @@
 from custom_utils.dp_storage import writer
-from pyspark.sql import SparkSession, DataFrame
+import pyspark.sql.functions as F
+from pyspark.sql import Column, SparkSession, DataFrame
+from pyspark.sql.types import ArrayType, DataType, DateType, MapType, NumericType, StringType, StructType, TimestampType
 from typing import List, Optional, Union
 from custom_utils.logging.logger import Logger
 
@@ -61,7 +63,8 @@ class DataStorageManager:
 
     def create_or_replace_table(self, spark: SparkSession, database_name: str, table_name: str, destination_path: str, cleaned_data_view: str, use_python: Optional[bool] = False):
         """
-        Creates or replaces a Delta table at the specified path, optionally using Python DataFrame operations.
+        Creates a Delta table at the specified path if it does not exist yet, optionally using Python DataFrame operations.
+        An existing table is left untouched.
         """
         try:
             # Access DataFrame from the specified view
@@ -82,50 +85,170 @@ class DataStorageManager:
             # Log the SQL query used for table creation
             self.logger.log_block("Table Creation Process", sql_query=create_table_sql)
 
-            if use_python:
+            if self.check_if_table_exists(spark, database_name, table_name):
+                # Never overwrite an existing table; its rows are merged into by execute_merge
+                self.logger.log_message(f"Table {database_name}.{table_name} already exists.")
+            elif use_python:
                 # Log DataFrame operation for table creation
-                self.logger.log_sql_query("Table Creation Process", [f"Writing DataFrame to Delta at path '{destination_path}' and registering table '{database_name}.{table_name}'."])
+                self.logger.log_block("Table Creation Process", [f"Writing DataFrame to Delta at path '{destination_path}' and registering table '{database_name}.{table_name}'."])
                 
                 # Write DataFrame to Delta format and register the table
                 df.write.format("delta").mode("overwrite").option("path", destination_path).saveAsTable(f"{database_name}.{table_name}")
                 
                 self.logger.log_message(f"Table {database_name}.{table_name} created using DataFrame operations.")
             else:
-                # Check if table already exists before creation
-                if not self.check_if_table_exists(spark, database_name, table_name):
-                    spark.sql(create_table_sql)
-                    self.logger.log_message(f"Table {database_name}.{table_name} created.")
-                    
-                    # Write data to the Delta table
-                    df.write.format("delta").mode("overwrite").save(destination_path)
-                    self.logger.log_message(f"Data written to {destination_path}.")
-                else:
-                    self.logger.log_message(f"Table {database_name}.{table_name} already exists.")
+                spark.sql(create_table_sql)
+                self.logger.log_message(f"Table {database_name}.{table_name} created.")
+                
+                # Write data to the Delta table
+                df.write.format("delta").mode("overwrite").save(destination_path)
+                self.logger.log_message(f"Data written to {destination_path}.")
         except Exception as e:
             self.logger.log_error(f"Error creating or replacing table: {e}")
             raise RuntimeError(f"Error creating or replacing table: {e}")
 
-    def generate_merge_sql(self, spark: SparkSession, cleaned_data_view: str, database_name: str, table_name: str, key_columns: Union[str, List[str]]) -> str:
+    @staticmethod
+    def _to_sql_literal(value: str, data_type: DataType) -> str:
+        """
+        Renders a value collected as a string as a typed SQL literal for the given column type.
+
+        Timestamps are collected as microseconds since the epoch (see `_key_value_column`) and rendered with
+        `timestamp_micros`, as a timestamp string carries no UTC offset and is ambiguous in DST transitions.
+        """
+        if isinstance(data_type, TimestampType):
+            return f"timestamp_micros({int(value)})"
+        escaped_value = value.replace("\\", "\\\\").replace("'", "\\'")
+        return f"CAST('{escaped_value}' AS {data_type.simpleString()})"
+
+    @staticmethod
+    def _key_value_column(col: str, data_type: DataType) -> Column:
+        """Returns the key column as collected for `_to_sql_literal`: timestamps as epoch microseconds."""
+        if isinstance(data_type, TimestampType):
+            return F.expr(f"unix_micros(`{col}`)")
+        return F.col(f"`{col}`")
+
+    @staticmethod
+    def _is_comparable(data_type: DataType) -> bool:
+        """Returns False if the data type contains a map, which Spark cannot compare with = or <=>."""
+        if isinstance(data_type, MapType):
+            return False
+        if isinstance(data_type, StructType):
+            return all(DataStorageManager._is_comparable(field.dataType) for field in data_type.fields)
+        if isinstance(data_type, ArrayType):
+            return DataStorageManager._is_comparable(data_type.elementType)
+        return True
+
+    def get_partition_columns(self, spark: SparkSession, database_name: str, table_name: str) -> List[str]:
+        """
+        Returns the partition columns of a Delta table.
+        """
+        from delta.tables import DeltaTable
+
+        table_detail = DeltaTable.forName(spark, f"{database_name}.{table_name}").detail().select("partitionColumns").first()
+        return list(table_detail["partitionColumns"] or []) if table_detail else []
+
+    def get_key_pruning_predicates(self, spark: SparkSession, cleaned_data_view: str, key_columns: List[str], partition_columns: Optional[List[str]] = None, max_partition_values: int = 100) -> List[str]:
+        """
+        Builds target-side predicates from the source key values so Delta can skip files during the MERGE.
+
+        Key columns that are also partition columns get a `t.key IN (...)` predicate on the distinct source values,
+        which prunes whole partitions. All other keys, and partition keys with more than `max_partition_values`
+        distinct values, fall back to `t.key BETWEEN min AND max`. The distinct values and the ranges are computed
+        in a single aggregation, so the source pipeline is only evaluated once before the MERGE.
+        """
+        source_df = spark.table(cleaned_data_view)
+        field_types = {field.name: field.dataType for field in source_df.schema.fields}
+        prunable_columns = [
+            col for col in key_columns
+            if isinstance(field_types.get(col), (NumericType, StringType, DateType, TimestampType))
+        ]
+        if not prunable_columns:
+            return []
+        set_columns = [col for col in prunable_columns if col in (partition_columns or [])]
+
+        aggregations = []
+        for col in prunable_columns:
+            aggregations.append(F.min(self._key_value_column(col, field_types[col])).cast("string"))
+            aggregations.append(F.max(self._key_value_column(col, field_types[col])).cast("string"))
+        for col in set_columns:
+            aggregations.append(F.collect_set(self._key_value_column(col, field_types[col]).cast("string")))
+        key_values = source_df.agg(*aggregations).first()
+
+        predicates = []
+        for index, col in enumerate(prunable_columns):
+            if col in set_columns:
+                partition_values = key_values[2 * len(prunable_columns) + set_columns.index(col)]
+                if len(partition_values) <= max_partition_values:
+                    if partition_values:
+                        in_values = ', '.join([self._to_sql_literal(value, field_types[col]) for value in sorted(partition_values)])
+                        predicates.append(f"t.`{col}` IN ({in_values})")
+                    continue
+
+            min_value, max_value = key_values[2 * index], key_values[2 * index + 1]
+            if min_value is None or max_value is None:
+                continue
+            predicates.append(
+                f"t.`{col}` BETWEEN {self._to_sql_literal(min_value, field_types[col])} "
+                f"AND {self._to_sql_literal(max_value, field_types[col])}"
+            )
+        return predicates
+
+    def generate_merge_conditions(self, spark: SparkSession, cleaned_data_view: str, database_name: str, table_name: str, key_columns: List[str]) -> dict:
+        """
+        Builds the merge condition, the change condition and the column lists shared by the SQL and DeltaTable merges.
+
+        The merge condition is narrowed with the source key values (partition values or key ranges) so Delta can prune
+        target files, and the change condition holds when every non-key column is equal, null-safe. Columns
+        containing maps are compared by their JSON representation, as Spark cannot compare maps directly.
+        """
+        target_types = {field.name: field.dataType for field in spark.table(f"{database_name}.{table_name}").schema}
+        source_types = {field.name: field.dataType for field in spark.table(cleaned_data_view).schema}
+        target_table_columns = list(target_types)
+        source_columns = list(source_types)
+        all_columns = [col for col in source_columns if col in target_table_columns and col not in key_columns]
+
+        match_conditions = [f"s.`{col}` = t.`{col}`" for col in key_columns]
+        unchanged_conditions = [
+            f"s.`{col}` <=> t.`{col}`"
+            if self._is_comparable(source_types[col]) and self._is_comparable(target_types[col])
+            else f"to_json(s.`{col}`) <=> to_json(t.`{col}`)"
+            for col in all_columns
+        ]
+        partition_columns = self.get_partition_columns(spark, database_name, table_name)
+        match_conditions += self.get_key_pruning_predicates(spark, cleaned_data_view, key_columns, partition_columns)
+
+        return {
+            "match_condition": ' AND '.join(match_conditions),
+            "unchanged_condition": ' AND '.join(unchanged_conditions),
+            "update_columns": all_columns,
+            "insert_columns": key_columns + all_columns,
+            "same_columns": set(source_columns) == set(target_table_columns),
+        }
+
+    def generate_merge_sql(self, spark: SparkSession, cleaned_data_view: str, database_name: str, table_name: str, key_columns: Union[str, List[str]], insert_only: bool = False) -> str:
         """
         Constructs the SQL query for a Delta MERGE operation, using specified key columns.
+
+        Matched rows are only updated when at least one column differs. With `insert_only`, matched rows are left untouched.
         """
         try:
             key_columns = self.normalize_key_columns(key_columns)
+            merge_conditions = self.generate_merge_conditions(spark, cleaned_data_view, database_name, table_name, key_columns)
 
-            target_table_columns = [field.name for field in spark.table(f"{database_name}.{table_name}").schema]
-            all_columns = [col for col in spark.table(cleaned_data_view).columns if col in target_table_columns and col not in key_columns]
-
-            match_sql = ' AND '.join([f"s.`{col}` = t.`{col}`" for col in key_columns])
-            update_sql = ', '.join([f"t.`{col}` = s.`{col}`" for col in all_columns])
-            insert_columns = key_columns + all_columns
+            update_sql = ', '.join([f"t.`{col}` = s.`{col}`" for col in merge_conditions["update_columns"]])
+            insert_columns = merge_conditions["insert_columns"]
             insert_values = [f"s.`{col}`" for col in insert_columns]
 
+            matched_sql = ""
+            if merge_conditions["update_columns"] and not insert_only:
+                matched_sql = f"""
+            WHEN MATCHED AND NOT ({merge_conditions['unchanged_condition']}) THEN
+                UPDATE SET {update_sql}"""
+
             merge_sql = f"""
             MERGE INTO {database_name}.{table_name} AS t
             USING {cleaned_data_view} AS s
-            ON {match_sql}
-            WHEN MATCHED THEN
-                UPDATE SET {update_sql}
+            ON {merge_conditions['match_condition']}{matched_sql}
             WHEN NOT MATCHED THEN
                 INSERT ({', '.join([f'`{col}`' for col in insert_columns])})
                 VALUES ({', '.join(insert_values)})
@@ -135,7 +258,101 @@ class DataStorageManager:
             self.logger.log_error(f"Error generating merge SQL: {e}")
             raise RuntimeError(f"Error generating merge SQL: {e}")
 
-    def execute_merge(self, spark: SparkSession, database_name: str, table_name: str, cleaned_data_view: str, key_columns: Union[str, List[str]], use_python: Optional[bool] = False) -> int:
+    def execute_merge_with_delta_api(self, spark: SparkSession, cleaned_data_view: str, database_name: str, table_name: str, key_columns: List[str], insert_only: bool = False) -> dict:
+        """
+        Executes the MERGE through the DeltaTable builder API and returns the merge statistics.
+
+        `whenMatchedUpdateAll`/`whenNotMatchedInsertAll` are used when source and target have the same columns,
+        so the assignments are resolved in one batch instead of column by column. Otherwise only the shared
+        columns are assigned, as in the SQL merge.
+        """
+        from delta.tables import DeltaTable
+
+        merge_conditions = self.generate_merge_conditions(spark, cleaned_data_view, database_name, table_name, key_columns)
+        same_columns = merge_conditions["same_columns"]
+
+        source_df = spark.table(cleaned_data_view)
+
+        self.logger.log_block("Executing Data Merge", [
+            f"Merging '{cleaned_data_view}' into '{database_name}.{table_name}' using the DeltaTable API.",
+            f"Merge condition: {merge_conditions['match_condition']}",
+        ])
+
+        merge_builder = (
+            DeltaTable.forName(spark, f"{database_name}.{table_name}").alias("t")
+            .merge(source_df.alias("s"), merge_conditions["match_condition"])
+        )
+        if merge_conditions["update_columns"] and not insert_only:
+            changed_condition = f"NOT ({merge_conditions['unchanged_condition']})"
+            if same_columns:
+                merge_builder = merge_builder.whenMatchedUpdateAll(condition=changed_condition)
+            else:
+                merge_builder = merge_builder.whenMatchedUpdate(
+                    condition=changed_condition,
+                    set={f"`{col}`": f"s.`{col}`" for col in merge_conditions["update_columns"]}
+                )
+        if same_columns:
+            merge_builder = merge_builder.whenNotMatchedInsertAll()
+        else:
+            merge_builder = merge_builder.whenNotMatchedInsert(
+                values={f"`{col}`": f"s.`{col}`" for col in merge_conditions["insert_columns"]}
+            )
+        pre_merge_version = self.get_table_version(spark, database_name, table_name)
+        merge_result = merge_builder.execute()
+
+        # Newer Delta versions return the merge metrics; otherwise read them from the merge commit
+        merge_rows = merge_result.collect() if merge_result is not None else []
+        if merge_rows:
+            return merge_rows[0].asDict()
+        return self.get_merge_metrics_from_history(spark, database_name, table_name, pre_merge_version)
+
+    def get_table_version(self, spark: SparkSession, database_name: str, table_name: str) -> Optional[int]:
+        """
+        Returns the current version of a Delta table from its newest history entry.
+        """
+        from delta.tables import DeltaTable
+
+        last_commit = DeltaTable.forName(spark, f"{database_name}.{table_name}").history(1).select("version").head()
+        return last_commit["version"] if last_commit else None
+
+    def get_merge_metrics_from_history(self, spark: SparkSession, database_name: str, table_name: str, pre_merge_version: Optional[int], max_commits: int = 10) -> dict:
+        """
+        Reads the version and row counts of the MERGE committed after `pre_merge_version` from its operationMetrics.
+
+        Only the newest `max_commits` history entries are read, so no table snapshot is scanned. Commits of other
+        operations are ignored; if no MERGE was committed (e.g. nothing changed), zero counts are returned.
+        """
+        from delta.tables import DeltaTable
+
+        history_df = DeltaTable.forName(spark, f"{database_name}.{table_name}").history(max_commits)
+        if pre_merge_version is not None:
+            history_df = history_df.filter(F.col("version") > pre_merge_version)
+        merge_commits = (
+            history_df.filter(F.col("operation") == "MERGE")
+            .select("version", "operationMetrics")
+            .orderBy("version")
+            .collect()
+        )
+
+        if not merge_commits:
+            self.logger.log_message(f"No MERGE commit found after version {pre_merge_version}; no rows were affected.")
+            return {"version": None, "num_deleted_rows": 0, "num_updated_rows": 0, "num_inserted_rows": 0}
+        if len(merge_commits) > 1:
+            self.logger.log_warning(
+                f"Found {len(merge_commits)} MERGE commits after version {pre_merge_version}; "
+                f"reporting the earliest (version {merge_commits[0]['version']})."
+            )
+
+        merge_commit = merge_commits[0]
+        operation_metrics = merge_commit["operationMetrics"] or {}
+        return {
+            "version": merge_commit["version"],
+            "num_deleted_rows": int(operation_metrics.get("numTargetRowsDeleted", 0)),
+            "num_updated_rows": int(operation_metrics.get("numTargetRowsUpdated", 0)),
+            "num_inserted_rows": int(operation_metrics.get("numTargetRowsInserted", 0)),
+        }
+
+    def execute_merge(self, spark: SparkSession, database_name: str, table_name: str, cleaned_data_view: str, key_columns: Union[str, List[str]], use_python: Optional[bool] = False, insert_only: Optional[bool] = False) -> int:
         """
         Executes the MERGE SQL operation and logs the SQL query and results.
         """
@@ -143,31 +360,38 @@ class DataStorageManager:
             key_columns = self.normalize_key_columns(key_columns)
 
             if use_python:
-                raise NotImplementedError("Python-based merge is not yet implemented.")
+                merge_stats = self.execute_merge_with_delta_api(spark, cleaned_data_view, database_name, table_name, key_columns, insert_only=insert_only)
             else:
                 # Generate the merge SQL query
-                merge_sql = self.generate_merge_sql(spark, cleaned_data_view, database_name, table_name, key_columns)
+                merge_sql = self.generate_merge_sql(spark, cleaned_data_view, database_name, table_name, key_columns, insert_only=insert_only)
                 self.logger.log_block("Executing Data Merge", sql_query=merge_sql)
 
                 # Execute the merge operation and capture the results
+                pre_merge_version = self.get_table_version(spark, database_name, table_name)
                 merge_result = spark.sql(merge_sql)
 
-                # Extract merge statistics
-                merge_stats = merge_result.collect()[0].asDict()
-                deleted_count = merge_stats.get("num_deleted_rows", 0)
-                updated_count = merge_stats.get("num_updated_rows", 0)
-                inserted_count = merge_stats.get("num_inserted_rows", 0)
-
-                # Log the results
-                self.logger.log_block("Merge Summary", [
-                    f"Deleted Records: {deleted_count}",
-                    f"Updated Records: {updated_count}",
-                    f"Inserted Records: {inserted_count}",
-                ])
-                total_affected_rows = deleted_count + updated_count + inserted_count
-                self.logger.log_message(f"Total number of affected rows: {total_affected_rows}")
-
-                return total_affected_rows
+                # Extract merge statistics, falling back to the merge commit's operationMetrics
+                merge_rows = merge_result.collect()
+                if merge_rows:
+                    merge_stats = merge_rows[0].asDict()
+                else:
+                    merge_stats = self.get_merge_metrics_from_history(spark, database_name, table_name, pre_merge_version)
+
+            deleted_count = merge_stats.get("num_deleted_rows", 0)
+            updated_count = merge_stats.get("num_updated_rows", 0)
+            inserted_count = merge_stats.get("num_inserted_rows", 0)
+
+            # Log the results
+            self.logger.log_block("Merge Summary", [
+                f"Table Version: {merge_stats['version']}" if merge_stats.get("version") is not None else "",
+                f"Deleted Records: {deleted_count}",
+                f"Updated Records: {updated_count}",
+                f"Inserted Records: {inserted_count}",
+            ])
+            total_affected_rows = deleted_count + updated_count + inserted_count
+            self.logger.log_message(f"Total number of affected rows: {total_affected_rows}")
+
+            return total_affected_rows
         except Exception as e:
             self.logger.log_end("Data Merge Process", success=False, additional_message=f"Error: {e}")
             self.logger.log_error(f"Error during data merge: {e}")
@@ -255,7 +479,8 @@ class DataStorageManager:
                               use_python: Optional[bool] = False, 
                               destination_folder_path: Optional[str] = None,  
                               destination_environment: Optional[str] = None, 
-                              source_datasetidentifier: Optional[str] = None):
+                              source_datasetidentifier: Optional[str] = None,
+                              insert_only: Optional[bool] = False):
         """
         Manage the data operation, allowing optional overriding of default config parameters.
         
@@ -268,6 +493,7 @@ class DataStorageManager:
             destination_folder_path (Optional[str]): Optional override for destination folder path.
             destination_environment (Optional[str]): Optional override for the destination database/environment.
             source_datasetidentifier (Optional[str]): Optional override for the source dataset/table identifier.
+            insert_only (Optional[bool]): If True, only inserts new keys and never rewrites matched rows.
         """
         self.logger.log_start("Manage Data Operation Process")
 
@@ -296,7 +522,7 @@ class DataStorageManager:
             self.create_or_replace_table(spark, destination_environment, source_datasetidentifier, destination_folder_path, cleaned_data_view, use_python=use_python)
 
             # Perform the merge operation
-            merge_result = self.execute_merge(spark, destination_environment, source_datasetidentifier, cleaned_data_view, key_columns, use_python=use_python)
+            merge_result = self.execute_merge(spark, destination_environment, source_datasetidentifier, cleaned_data_view, key_columns, use_python=use_python, insert_only=insert_only)
 
             # Log merge result
             if merge_result == 0:
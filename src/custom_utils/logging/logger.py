@@ -105,9 +105,23 @@ class Logger:
             query (str): SQL query string.
             level (str): Log level for the query.
         """
+        log_level = getattr(logging, level.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(log_level):
+            return
+
+        self.log_message(f"SQL Query:\n{self._format_sql_query(query)}", level=level)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _format_sql_query(query: str) -> str:
+        """
+        Reindent and highlight an SQL query. Cached, as the same statements are typically logged on every run.
+
+        Args:
+            query (str): SQL query string.
+        """
         formatted_query = sqlparse.format(query, reindent=True, keyword_case='upper')
-        highlighted_query = highlight(formatted_query, SqlLexer(), TerminalFormatter())
-        self.log_message(f"SQL Query:\n{highlighted_query}", level=level)
+        return highlight(formatted_query, SqlLexer(), TerminalFormatter())
 
     def log_python_code(self, code: str, level: str = "info"):
         """
@@ -117,6 +131,10 @@ class Logger:
             code (str): Python code string.
             level (str): Log level for the code.
         """
+        log_level = getattr(logging, level.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(log_level):
+            return
+
         highlighted_code = highlight(code, PythonLexer(), TerminalFormatter())
         self.log_message(f"Python Code:\n{highlighted_code}", level=level)
 
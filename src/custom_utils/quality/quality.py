@@ -1,10 +1,24 @@
 import pyspark.sql.functions as F
+from functools import partial
 from typing import List, Dict, Tuple, Optional, Union
 from pyspark.sql import DataFrame, SparkSession, Window
+from pyspark.sql.types import ArrayType, DataType, MapType, StructType
 from pyspark.sql.utils import AnalysisException
+from pyspark.storagelevel import StorageLevel
 from custom_utils.logging.logger import Logger
 
 class DataQualityManager:
+    # Available checks in execution order: (check name, arguments that must all be provided, description)
+    _CHECKS = [
+        ("Handling Multiple Files", ("key_columns",), "Triggered by 'key_columns'. Uses input_file_name to keep the latest record per key."),
+        ("Duplicate Check", ("key_columns",), "Triggered by 'key_columns'. Checks for duplicate records based on specified columns."),
+        ("Null Values Check", ("critical_columns",), "Triggered by 'critical_columns'. Checks for null values in specified columns."),
+        ("Value Range Check", ("column_ranges",), "Triggered by 'column_ranges'. Checks if values in specified columns are within the provided ranges."),
+        ("Referential Integrity Check", ("reference_df", "join_column"), "Triggered by 'reference_df' and 'join_column'. Checks if all records have matching references in another dataset."),
+        ("Field Consistency Check", ("consistency_pairs",), "Triggered by 'consistency_pairs'. Checks if values in specified column pairs are consistent (e.g., start date < end date)."),
+        ("Exclude Columns", ("columns_to_exclude",), "Triggered by 'columns_to_exclude'. Drops specified columns from the DataFrame."),
+    ]
+
     def __init__(self, logger, debug=False):
         """
         Initializes the DataQualityManager with logging and debugging capabilities.
@@ -35,35 +49,24 @@ class DataQualityManager:
         else:
             raise ValueError(f"Invalid type for key_columns: {type(key_columns)}. Expected str or list.")
 
+    @staticmethod
+    def _is_orderable(data_type: DataType) -> bool:
+        """Returns False if the data type contains a map, which Spark cannot compare in max()."""
+        if isinstance(data_type, MapType):
+            return False
+        if isinstance(data_type, StructType):
+            return all(DataQualityManager._is_orderable(field.dataType) for field in data_type.fields)
+        if isinstance(data_type, ArrayType):
+            return DataQualityManager._is_orderable(data_type.elementType)
+        return True
+
     def _list_available_checks(self):
         """Lists all available checks with a description of their parameters."""
-        return {
-            "Handling Multiple Files": "Triggered by 'key_columns'. Uses input_file_name to keep the latest record per key.",
-            "Duplicate Check": "Triggered by 'key_columns'. Checks for duplicate records based on specified columns.",
-            "Null Values Check": "Triggered by 'critical_columns'. Checks for null values in specified columns.",
-            "Value Range Check": "Triggered by 'column_ranges'. Checks if values in specified columns are within the provided ranges.",
-            "Referential Integrity Check": "Triggered by 'reference_df' and 'join_column'. Checks if all records have matching references in another dataset.",
-            "Field Consistency Check": "Triggered by 'consistency_pairs'. Checks if values in specified column pairs are consistent (e.g., start date < end date).",
-            "Exclude Columns": "Triggered by 'columns_to_exclude'. Drops specified columns from the DataFrame."
-        }
+        return {check: description for check, _, description in self._CHECKS}
 
     def _list_checks_to_perform(self, **kwargs) -> List[str]:
         """Generates a list of checks to be performed based on input arguments."""
-        checks_to_perform = []
-        if kwargs.get('key_columns'):
-            checks_to_perform.append('Handling Multiple Files')
-            checks_to_perform.append('Duplicate Check')
-        if kwargs.get('critical_columns'):
-            checks_to_perform.append('Null Values Check')
-        if kwargs.get('column_ranges'):
-            checks_to_perform.append('Value Range Check')
-        if kwargs.get('reference_df') and kwargs.get('join_column'):
-            checks_to_perform.append('Referential Integrity Check')
-        if kwargs.get('consistency_pairs'):
-            checks_to_perform.append('Field Consistency Check')
-        if kwargs.get('columns_to_exclude'):
-            checks_to_perform.append('Exclude Columns')
-        return checks_to_perform
+        return [check for check, triggers, _ in self._CHECKS if all(kwargs.get(arg) for arg in triggers)]
 
     def describe_available_checks(self):
         """Logs the available checks and the parameters required to trigger them."""
@@ -93,19 +96,19 @@ class DataQualityManager:
         # Parse key_columns to ensure consistency
         key_columns = self.parse_key_columns(key_columns)
 
-        # Include 'input_file_name' in key_columns
-        key_columns = list(set(['input_file_name'] + key_columns))
+        # Include 'input_file_name' in key_columns, keeping a deterministic column order
+        key_columns = list(dict.fromkeys(['input_file_name'] + key_columns))
 
         # Parse order_by
         order_by = self.parse_key_columns(order_by or 'input_file_name')
 
-        # Construct the order_by clause for SQL
-        order_by_clause = ", ".join([f"{col} DESC" for col in order_by])
-
         self.logger.log_block("Handling Multiple Files", [f"Key columns: {key_columns}", f"Order by: {order_by}"])
 
         try:
             if use_sql:
+                # Construct the order_by clause for SQL
+                order_by_clause = ", ".join([f"{col} DESC" for col in order_by])
+
                 df.createOrReplaceTempView("temp_original_data")
                 query = f"""
                     CREATE OR REPLACE TEMP VIEW temp_recent_data AS
@@ -115,9 +118,20 @@ class DataQualityManager:
                         FROM temp_original_data t
                     ) x WHERE rnr = 1
                 """
-                self.logger.log_sql_query(query)
+                self.logger.log_sql_query(query, level="debug")
                 spark.sql(query)
                 df = spark.sql("SELECT * FROM temp_recent_data").drop("rnr")
+            elif order_by == ['input_file_name'] and all(self._is_orderable(field.dataType) for field in df.schema.fields):
+                # Partial aggregation of the max struct ships at most one row per key per task into the shuffle,
+                # where the window shuffles every row. Spark still plans a SortAggregate (sorting on both sides
+                # of the exchange), as a struct buffer cannot be held by hash aggregation.
+                struct_columns = ['input_file_name'] + [col for col in df.columns if col != 'input_file_name']
+                df = (
+                    df.groupBy(*key_columns)
+                    .agg(F.max(F.struct(*[F.col(f"`{col}`") for col in struct_columns])).alias("_latest"))
+                    .select("_latest.*")
+                    .select(*[F.col(f"`{col}`") for col in df.columns])
+                )
             else:
                 window_spec = Window.partitionBy(key_columns).orderBy(*[F.col(col).desc() for col in order_by])
                 df = df.withColumn("rnr", F.row_number().over(window_spec)).filter(F.col("rnr") == 1).drop("rnr")
@@ -133,7 +147,8 @@ class DataQualityManager:
         key_columns: Union[str, List[str]],
         feedback_column: Optional[str] = None,
         remove_duplicates: bool = False,
-        use_sql: bool = False
+        use_sql: bool = False,
+        known_duplicate_count: Optional[int] = None
     ) -> DataFrame:
         """
         Checks for duplicate rows in the DataFrame.
@@ -145,6 +160,8 @@ class DataQualityManager:
             feedback_column (Optional[str]): Column for ordering during duplicate removal.
             remove_duplicates (bool): Whether to remove duplicates.
             use_sql (bool): Whether to use SQL or DataFrame operations.
+            known_duplicate_count (Optional[int]): Surplus duplicate records already counted, e.g. by the fused checks.
+                When provided, the duplicates are not counted again.
 
         Returns:
             DataFrame: Processed DataFrame.
@@ -152,6 +169,7 @@ class DataQualityManager:
         # Parse key_columns
         key_columns = self.parse_key_columns(key_columns)
         self.logger.log_block("Duplicate Check", [f"Key columns: {key_columns}"])
+        duplicate_unit = "duplicate groups" if known_duplicate_count is None else "duplicate records"
 
         try:
             if use_sql:
@@ -163,14 +181,23 @@ class DataQualityManager:
                     GROUP BY {', '.join(key_columns)}
                     HAVING COUNT(*) > 1
                 """
-                self.logger.log_sql_query(query)
+                self.logger.log_sql_query(query, level="debug")
                 duplicates_df = spark.sql(query)
-                duplicate_count = duplicates_df.count()
+                # Unless already counted, probe for a single duplicate group and count the groups only on failure
+                if known_duplicate_count is not None:
+                    duplicate_count = known_duplicate_count
+                else:
+                    duplicate_count = 0 if duplicates_df.isEmpty() else duplicates_df.count()
             else:
-                # DataFrame-based duplicate check
+                # DataFrame-based duplicate check: unless already counted, compare total and distinct key counts
+                # in a single aggregation, grouping the duplicate keys only when duplicates exist
                 duplicates_df = df.groupBy(key_columns).count().filter(F.col("count") > 1)
-                duplicate_count = duplicates_df.count()
-                self.logger.log_message(f"Duplicate check identified {duplicate_count} duplicate groups based on key columns {key_columns}.")
+                if known_duplicate_count is not None:
+                    duplicate_count = known_duplicate_count
+                else:
+                    row_count, distinct_count = df.agg(F.count(F.lit(1)), F.countDistinct(F.struct(*key_columns))).first()
+                    duplicate_count = duplicates_df.count() if row_count != distinct_count else 0
+                self.logger.log_message(f"Duplicate check identified {duplicate_count} {duplicate_unit} based on key columns {key_columns}.")
 
             if duplicate_count > 0:
                 # Define columns to select for duplicate details
@@ -192,7 +219,7 @@ class DataQualityManager:
                 # Display duplicate details
                 self.logger.log_block("Duplicate Records Found", [
                     f"Details of duplicates based on {key_columns}:",
-                    f"Total duplicate groups: {duplicate_count}"
+                    f"Total {duplicate_unit}: {duplicate_count}"
                 ])
                 self.logger.log_message("Duplicate details table (showing first few records):")
                 detailed_duplicates_df.show(truncate=False)
@@ -220,7 +247,7 @@ class DataQualityManager:
                             ) x
                             WHERE rnr = 1
                         """
-                        self.logger.log_sql_query(f"SQL query used to remove duplicates:\n{deduplicate_query}\n")
+                        self.logger.log_sql_query(f"SQL query used to remove duplicates:\n{deduplicate_query}\n", level="debug")
                         spark.sql(deduplicate_query)
                         df = spark.sql("SELECT * FROM temp_deduplicated_data").drop("rnr")
                     else:
@@ -236,137 +263,181 @@ class DataQualityManager:
         except Exception as e:
             self.logger.log_error(f"Failed to check for duplicates: {e}")
 
-    def _check_for_nulls(self, spark: SparkSession, df: DataFrame, critical_columns: List[str], use_python: bool = False):
-        """Checks for null values in the specified critical columns using either SQL or Python."""
-        self.logger.log_block("Null Values Check", [f"Checking for null values in columns: {critical_columns}"])
-        try:
-            if use_python:
-                for col in critical_columns:
-                    # Python approach
-                    null_count = df.filter(F.col(col).isNull()).count()
-                    python_code = f"df.filter(F.col('{col}').isNull()).count()"
-                    self.logger.log_python_code(python_code)
-
-                    if null_count > 0:
-                        self.logger.log_error(f"Null values check failed: Column '{col}' has {null_count} missing values.")
-                    else:
-                        self.logger.log_message(f"Column '{col}' has no missing values.")
-            else:
-                # SQL approach
-                df.createOrReplaceTempView("temp_view_check_nulls")
-                null_check_query = " UNION ALL ".join([
-                    f"SELECT COUNT(*) AS null_count, '{col}' AS column_name FROM temp_view_check_nulls WHERE {col} IS NULL"
-                    for col in critical_columns
-                ])
-                self.logger.log_sql_query(f"The following SQL query is used to check for null values:\n{null_check_query}\n")
-
-                nulls_df = spark.sql(null_check_query)
-                for row in nulls_df.collect():
-                    if row['null_count'] > 0:
-                        self.logger.log_error(f"Null values check failed: Column '{row['column_name']}' has {row['null_count']} missing values.")
-                self.logger.log_message("Null values check passed: No missing values found in specified columns.")
-        except Exception as e:
-            self.logger.log_error(f"Failed to check for null values: {e}")
-
-    def _check_value_ranges(self, spark: SparkSession, df: DataFrame, column_ranges: Dict[str, Tuple[float, float]], use_python: bool = False):
-        """Checks if values in the specified columns are within the provided ranges using either SQL or Python."""
-        self.logger.log_block("Value Range Check", [f"Checking value ranges for columns: {list(column_ranges.keys())}"])
-        try:
-            if use_python:
-                for col, (min_val, max_val) in column_ranges.items():
-                    # Python approach
-                    out_of_range_count = df.filter((F.col(col) < min_val) | (F.col(col) > max_val)).count()
-                    python_code = f"df.filter((F.col('{col}') < {min_val}) | (F.col('{col}') > {max_val})).count()"
-                    self.logger.log_python_code(python_code)
-
-                    if out_of_range_count > 0:
-                        self.logger.log_error(f"Value range check failed: Column '{col}' has {out_of_range_count} values out of range [{min_val}, {max_val}].")
-                    else:
-                        self.logger.log_message(f"Column '{col}' values are within the specified range [{min_val}, {max_val}].")
-            else:
-                # SQL approach
-                df.createOrReplaceTempView("temp_view_check_ranges")
-                range_check_query = " UNION ALL ".join([
-                    f"SELECT COUNT(*) AS out_of_range_count, '{col}' AS column_name FROM temp_view_check_ranges WHERE {col} < {min_val} OR {col} > {max_val}"
-                    for col, (min_val, max_val) in column_ranges.items()
-                ])
-                self.logger.log_sql_query(f"The following SQL query is used to check value ranges:\n{range_check_query}\n")
-
-                ranges_df = spark.sql(range_check_query)
-                for row in ranges_df.collect():
-                    if row['out_of_range_count'] > 0:
-                        self.logger.log_error(f"Value range check failed: Column '{row['column_name']}' has {row['out_of_range_count']} values out of range.")
-                self.logger.log_message("Value range check passed: All values are within the specified ranges.")
-        except Exception as e:
-            self.logger.log_error(f"Failed to check value ranges: {e}")
+    def _log_check_results(self, failures: List[str], failure_prefix: str):
+        """Raises once for a check, listing the failures of all its columns."""
+        if failures:
+            self.logger.log_error(f"{failure_prefix}: {' '.join(failures)}")
 
     def _check_referential_integrity(self, spark: SparkSession, df: DataFrame, reference_df: DataFrame, join_column: str, use_python: bool = False):
         """Checks if all records in the DataFrame have matching references in the reference DataFrame using either SQL or Python."""
         self.logger.log_block("Referential Integrity Check", [f"Checking referential integrity on column '{join_column}'"])
         try:
+            # Only the distinct join keys of the reference data are needed
+            reference_keys_df = reference_df.select(join_column).distinct()
+
             if use_python:
-                # Python approach
-                unmatched_count = df.join(reference_df, df[join_column] == reference_df[join_column], "left_anti").count()
-                python_code = f"df.join(reference_df, df['{join_column}'] == reference_df['{join_column}'], 'left_anti').count()"
+                # Python approach: probe for a single unmatched record, count only on failure
+                unmatched_df = df.join(reference_keys_df, on=join_column, how="left_anti")
+                python_code = f"df.join(reference_df.select('{join_column}').distinct(), on='{join_column}', how='left_anti').limit(1).take(1)"
                 self.logger.log_python_code(python_code)
 
-                if unmatched_count > 0:
-                    self.logger.log_error(f"Referential integrity check failed: {unmatched_count} records in '{join_column}' do not match the reference data.")
+                if unmatched_df.limit(1).take(1):
+                    self.logger.log_error(f"Referential integrity check failed: {unmatched_df.count()} records in '{join_column}' do not match the reference data.")
                 else:
                     self.logger.log_message(f"Referential integrity check passed for column '{join_column}'.")
             else:
                 # SQL approach
                 df.createOrReplaceTempView("temp_view_check_referential")
-                reference_df.createOrReplaceTempView("reference_view")
+                reference_keys_df.createOrReplaceTempView("reference_view")
                 referential_query = f"""
                     SELECT COUNT(*) AS unmatched_count
                     FROM temp_view_check_referential t
                     LEFT JOIN reference_view r ON t.{join_column} = r.{join_column}
                     WHERE r.{join_column} IS NULL
                 """
-                self.logger.log_sql_query(f"The following SQL query is used to check referential integrity:\n{referential_query}\n")
+                self.logger.log_sql_query(f"The following SQL query is used to check referential integrity:\n{referential_query}\n", level="debug")
 
                 referential_df = spark.sql(referential_query)
                 unmatched_count = referential_df.collect()[0]['unmatched_count']
 
                 if unmatched_count > 0:
-                    sself.logger.log_error(f"Referential integrity check failed: {unmatched_count} records in '{join_column}' do not match the reference data.")
+                    self.logger.log_error(f"Referential integrity check failed: {unmatched_count} records in '{join_column}' do not match the reference data.")
                 else:
                     self.logger.log_message(f"Referential integrity check passed for column '{join_column}'.")
         except Exception as e:
             self.logger.log_error(f"Failed to check referential integrity: {e}")
 
-    def _check_consistency_between_fields(self, spark: SparkSession, df: DataFrame, consistency_pairs: List[Tuple[str, str]], use_python: bool = False):
-        """Checks consistency between specified field pairs using either SQL or Python."""
-        self.logger.log_block("Field Consistency Check", [f"Checking consistency between field pairs: {consistency_pairs}"])
-        try:
-            if use_python:
-                for col1, col2 in consistency_pairs:
-                    # Python approach
-                    inconsistency_count = df.filter(F.col(col1) > F.col(col2)).count()
-                    python_code = f"df.filter(F.col('{col1}') > F.col('{col2}')).count()"
-                    self.logger.log_python_code(python_code)
-
-                    if inconsistency_count > 0:
-                        self.logger.log_error(f"Consistency check failed: {inconsistency_count} records have '{col1}' greater than '{col2}'.")
-                    else:
-                        self.logger.log_message(f"Consistency check passed for '{col1}' and '{col2}'.")
-            else:
-                # SQL approach
-                df.createOrReplaceTempView("temp_view_check_consistency")
-                consistency_queries = " UNION ALL ".join([
-                    f"SELECT COUNT(*) AS inconsistency_count, '{col1}' AS column_1, '{col2}' AS column_2 FROM temp_view_check_consistency WHERE {col1} > {col2}"
-                    for col1, col2 in consistency_pairs
-                ])
-                self.logger.log_sql_query(f"The following SQL query is used to check field consistency:\n{consistency_queries}\n")
+    def _run_fused_checks(
+        self,
+        df: DataFrame,
+        critical_columns: Optional[List[str]] = None,
+        column_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+        consistency_pairs: Optional[List[Tuple[str, str]]] = None,
+        key_columns: Optional[List[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Computes null, value range, field consistency and duplicate counts in a single aggregation,
+        so the DataFrame is scanned once instead of once per check and column.
 
-                consistency_df = spark.sql(consistency_queries)
-                for row in consistency_df.collect():
-                    if row['inconsistency_count'] > 0:
-                        self.logger.log_error(f"Consistency check failed: {row['inconsistency_count']} records have '{row['column_1']}' greater than '{row['column_2']}'.")
-                self.logger.log_message("Consistency check passed for all specified pairs.")
-        except Exception as e:
-            self.logger.log_error(f"Failed to check field consistency: {e}")
+        Args:
+            df (DataFrame): Input DataFrame.
+            critical_columns (Optional[List[str]]): Columns to count null values in.
+            column_ranges (Optional[Dict[str, Tuple[float, float]]]): Value ranges to count violations of.
+            consistency_pairs (Optional[List[Tuple[str, str]]]): Column pairs to count records where the first exceeds the second.
+            key_columns (Optional[List[str]]): Columns to count duplicate records on.
+
+        Returns:
+            Dict[str, Dict]: Counts per check, keyed by column (or column pair), plus the surplus of duplicate records.
+        """
+        checks = []
+        for col in critical_columns or []:
+            checks.append(("nulls", col, F.when(F.col(col).isNull(), 1),
+                           f"F.when(F.col('{col}').isNull(), 1)"))
+        for col, (min_val, max_val) in (column_ranges or {}).items():
+            checks.append(("ranges", col, F.when((F.col(col) < min_val) | (F.col(col) > max_val), 1),
+                           f"F.when((F.col('{col}') < {min_val}) | (F.col('{col}') > {max_val}), 1)"))
+        for col1, col2 in consistency_pairs or []:
+            checks.append(("consistency", (col1, col2), F.when(F.col(col1) > F.col(col2), 1),
+                           f"F.when(F.col('{col1}') > F.col('{col2}'), 1)"))
+
+        aggregations = [F.coalesce(F.sum(condition), F.lit(0)) for _, _, condition, _ in checks]
+        python_code = [f"F.coalesce(F.sum({code}), F.lit(0))" for _, _, _, code in checks]
+        if key_columns:
+            aggregations.append(F.count(F.lit(1)) - F.countDistinct(F.struct(*key_columns)))
+            python_code.append(f"F.count(F.lit(1)) - F.countDistinct(F.struct(*{key_columns}))")
+
+        results = {"nulls": {}, "ranges": {}, "consistency": {}, "duplicates": None}
+        if not aggregations:
+            return results
+
+        self.logger.log_python_code("df.agg(\n    " + ",\n    ".join(python_code) + "\n).first()", level="debug")
+        counts = df.agg(*aggregations).first()
+
+        for index, (check, label, _, _) in enumerate(checks):
+            results[check][label] = counts[index]
+        if key_columns:
+            results["duplicates"] = counts[len(checks)]
+        return results
+
+    def _run_sql_fused_checks(
+        self,
+        spark: SparkSession,
+        df: DataFrame,
+        critical_columns: Optional[List[str]] = None,
+        column_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+        consistency_pairs: Optional[List[Tuple[str, str]]] = None,
+        key_columns: Optional[List[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        SQL counterpart of `_run_fused_checks`: computes all counts with a single aggregating query,
+        so Spark runs one job with one scan instead of one query per check.
+
+        Args:
+            spark (SparkSession): Spark session.
+            df (DataFrame): Input DataFrame.
+            critical_columns (Optional[List[str]]): Columns to count null values in.
+            column_ranges (Optional[Dict[str, Tuple[float, float]]]): Value ranges to count violations of.
+            consistency_pairs (Optional[List[Tuple[str, str]]]): Column pairs to count records where the first exceeds the second.
+            key_columns (Optional[List[str]]): Columns to count duplicate records on.
+
+        Returns:
+            Dict[str, Dict]: Counts per check, keyed by column (or column pair), plus the surplus of duplicate records.
+        """
+        checks = []
+        for col in critical_columns or []:
+            checks.append(("nulls", col, f"{col} IS NULL"))
+        for col, (min_val, max_val) in (column_ranges or {}).items():
+            checks.append(("ranges", col, f"{col} < {min_val} OR {col} > {max_val}"))
+        for col1, col2 in consistency_pairs or []:
+            checks.append(("consistency", (col1, col2), f"{col1} > {col2}"))
+
+        aggregations = [f"COALESCE(SUM(CASE WHEN {condition} THEN 1 END), 0)" for _, _, condition in checks]
+        if key_columns:
+            aggregations.append(f"COUNT(*) - COUNT(DISTINCT struct({', '.join(key_columns)}))")
+
+        results = {"nulls": {}, "ranges": {}, "consistency": {}, "duplicates": None}
+        if not aggregations:
+            return results
+
+        df.createOrReplaceTempView("temp_view_fused_checks")
+        fused_check_query = f"SELECT {', '.join(aggregations)} FROM temp_view_fused_checks"
+        self.logger.log_sql_query(f"The following SQL query is used for the fused quality checks:\n{fused_check_query}\n", level="debug")
+        counts = spark.sql(fused_check_query).first()
+
+        for index, (check, label, _) in enumerate(checks):
+            results[check][label] = counts[index]
+        if key_columns:
+            results["duplicates"] = counts[len(checks)]
+        return results
+
+    def _report_fused_checks(self, results: Dict[str, Dict], column_ranges: Optional[Dict[str, Tuple[float, float]]] = None):
+        """Logs the outcome of the counts computed by `_run_fused_checks` and raises on the first failing check."""
+        if results["nulls"]:
+            self.logger.log_block("Null Values Check", [f"Checking for null values in columns: {list(results['nulls'].keys())}"])
+            failures = [
+                f"Column '{col}' has {null_count} missing values."
+                for col, null_count in results["nulls"].items() if null_count > 0
+            ]
+            self._log_check_results(failures, "Null values check failed")
+            self.logger.log_message("Null values check passed: No missing values found in specified columns.")
+
+        if results["ranges"]:
+            self.logger.log_block("Value Range Check", [f"Checking value ranges for columns: {list(results['ranges'].keys())}"])
+            failures = [
+                f"Column '{col}' has {out_of_range_count} values out of range [{column_ranges[col][0]}, {column_ranges[col][1]}]."
+                for col, out_of_range_count in results["ranges"].items() if out_of_range_count > 0
+            ]
+            self._log_check_results(failures, "Value range check failed")
+            self.logger.log_message("Value range check passed: All values are within the specified ranges.")
+
+        if results["consistency"]:
+            self.logger.log_block("Field Consistency Check", [f"Checking consistency between field pairs: {list(results['consistency'].keys())}"])
+            failures = [
+                f"{inconsistency_count} records have '{col1}' greater than '{col2}'."
+                for (col1, col2), inconsistency_count in results["consistency"].items() if inconsistency_count > 0
+            ]
+            self._log_check_results(failures, "Consistency check failed")
+            self.logger.log_message("Consistency check passed for all specified pairs.")
 
     def perform_data_quality_checks(
         self,
@@ -426,47 +497,89 @@ class DataQualityManager:
         # Log the quality checks that will be performed
         self.logger.log_block("Quality Checks to Perform", [f"Checks to be performed: {', '.join(checks_to_perform)}"])
 
+        cached_df = None
+
         try:
             # Handling multiple files: Keeps the latest record based on `input_file_name` and `order_by`
             if 'Handling Multiple Files' in checks_to_perform:
                 df = self._handle_multiple_files(spark, df, key_columns, order_by=order_by, use_sql=not use_python)
 
-            # Check for duplicates and optionally remove them
             # If feedback_column is provided, use it for ordering during duplicate removal, else fallback to order_by
             duplicate_order_column = feedback_column if feedback_column else order_by
+
+            # Exclude columns that no check depends on right away, so they are neither cached nor shuffled;
+            # the remaining excluded columns are dropped once the checks are done
+            deferred_exclusions = []
+            if 'Exclude Columns' in checks_to_perform:
+                required_columns = set(key_columns) | {'input_file_name'}
+                required_columns |= set(critical_columns or []) | set((column_ranges or {}).keys())
+                required_columns |= {col for pair in consistency_pairs or [] for col in pair}
+                if duplicate_order_column:
+                    required_columns |= set(self.parse_key_columns(duplicate_order_column))
+                if join_column:
+                    required_columns.add(join_column)
+                columns_present = [col for col in columns_to_exclude if col in df.columns]
+                deferred_exclusions = [col for col in columns_present if col in required_columns]
+
+                # Skip the projection entirely when there is nothing to drop yet
+                columns_to_drop = [col for col in columns_present if col not in required_columns]
+                if columns_to_drop:
+                    df = df.drop(*columns_to_drop)
+
+            # Cache the records once so the checks below do not re-read the source files and re-run the
+            # window from `_handle_multiple_files`; the count materializes the cache before the first check
+            cached_df = df.persist(StorageLevel.MEMORY_AND_DISK)
+            df = cached_df
+            df.count()
+
+            # Duplicate, null, range and consistency counts come from one aggregation pass over the records;
+            # duplicates are then inspected and optionally removed
+            run_fused_checks = self._run_fused_checks if use_python else partial(self._run_sql_fused_checks, spark)
+            fused_results = run_fused_checks(
+                df,
+                critical_columns=critical_columns if 'Null Values Check' in checks_to_perform else None,
+                column_ranges=column_ranges if 'Value Range Check' in checks_to_perform else None,
+                consistency_pairs=consistency_pairs if 'Field Consistency Check' in checks_to_perform else None,
+                key_columns=key_columns if 'Duplicate Check' in checks_to_perform else None
+            )
+
             if 'Duplicate Check' in checks_to_perform:
-                try:
-                    # Attempt to handle duplicates and potentially remove them
-                    df = self._check_for_duplicates(
-                        spark, df, key_columns, feedback_column=duplicate_order_column,
-                        remove_duplicates=remove_duplicates, use_sql=not use_python
+                if fused_results["duplicates"] == 0:
+                    self.logger.log_block("Duplicate Check", [f"Key columns: {key_columns}"])
+                    self.logger.log_message("Duplicate check passed: No duplicates found.")
+                else:
+                    try:
+                        # Attempt to handle duplicates and potentially remove them
+                        df = self._check_for_duplicates(
+                            spark, df, key_columns, feedback_column=duplicate_order_column,
+                            remove_duplicates=remove_duplicates, use_sql=not use_python,
+                            known_duplicate_count=fused_results["duplicates"]
+                        )
+                    except RuntimeError as dup_error:
+                        # Catch and log duplicate error without re-raising it if remove_duplicates is enabled
+                        if remove_duplicates:
+                            self.logger.log_message("Duplicates were found and removed as per the remove_duplicates parameter.")
+                        else:
+                            raise dup_error
+
+                    # Re-count the remaining checks on the deduplicated records
+                    fused_results = run_fused_checks(
+                        df,
+                        critical_columns=list(fused_results["nulls"].keys()),
+                        column_ranges={col: column_ranges[col] for col in fused_results["ranges"]},
+                        consistency_pairs=list(fused_results["consistency"].keys())
                     )
-                except RuntimeError as dup_error:
-                    # Catch and log duplicate error without re-raising it if remove_duplicates is enabled
-                    if remove_duplicates:
-                        self.logger.log_message("Duplicates were found and removed as per the remove_duplicates parameter.")
-                    else:
-                        raise dup_error
-
-            # Check for null values in specified critical columns
-            if 'Null Values Check' in checks_to_perform:
-                self._check_for_nulls(spark, df, critical_columns, use_python=use_python)
 
-            # Check if values in specified columns fall within the defined ranges
-            if 'Value Range Check' in checks_to_perform:
-                self._check_value_ranges(spark, df, column_ranges, use_python=use_python)
+            self._report_fused_checks(fused_results, column_ranges)
 
             # Verify referential integrity by checking for matching records in `reference_df`
             if 'Referential Integrity Check' in checks_to_perform:
                 self._check_referential_integrity(spark, df, reference_df, join_column, use_python=use_python)
 
-            # Check consistency between specified column pairs (e.g., start_date < end_date)
-            if 'Field Consistency Check' in checks_to_perform:
-                self._check_consistency_between_fields(spark, df, consistency_pairs, use_python=use_python)
-
             # Exclude specified columns from the final DataFrame
             if 'Exclude Columns' in checks_to_perform:
-                df = df.drop(*columns_to_exclude)
+                if deferred_exclusions:
+                    df = df.drop(*deferred_exclusions)
                 self.logger.log_block("Excluding Columns", [f"Excluded columns: {columns_to_exclude}"])
 
             # Create the final view of the processed DataFrame
@@ -485,4 +598,9 @@ class DataQualityManager:
             error_message = f"Data quality checks failed: {e}"
             self.logger.log_error(error_message)
             self.logger.log_end("Data Quality Check Process", success=False)
-            raise RuntimeError(error_message)
\ No newline at end of file
+            raise RuntimeError(error_message)
+
+        finally:
+            # Release the cached records; the returned view is recomputed lazily by its consumers
+            if cached_df is not None:
+                cached_df.unpersist()
\ No newline at end of file